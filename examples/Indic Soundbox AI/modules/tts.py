@@ -12,6 +12,25 @@ SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
 TTS_CHARACTER_LIMIT = 2500 # As per Sarvam API documentation (bulbul:v3)
 MIN_TEXT_LENGTH_FOR_FORCED_TWO_WAY_SPLIT = 20 # Chars, don't split very short texts forcibly
 
+# Patterns used by _clean_text_for_tts, compiled once at import time
+_BOLD_ITALIC_RE = re.compile(r'\*\*\*(.*?)\*\*\*')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.*?)\*')
+_HEADER_RE = re.compile(r'^#+\s*', flags=re.MULTILINE)
+# Remove emojis (this is a basic range, more comprehensive regex is possible but larger)
+# Basic BMP emoji pattern
+_EMOJI_RE = re.compile("["
+                       u"\U0001F600-\U0001F64F"  # emoticons
+                       u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                       u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                       u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+                       u"\u2600-\u26FF"          # miscellaneous symbols
+                       u"\u2700-\u27BF"          # dingbats
+                       u"\uFE0F"                # variation selector
+                       u"\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
+                       "]+", flags=re.UNICODE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def _clean_text_for_tts(text_input):
     """Cleans text by removing common markdown, multiple spaces, and emojis."""
     if not text_input:
@@ -19,28 +38,17 @@ def _clean_text_for_tts(text_input):
 
     # Remove common markdown (asterisks for bold/italics, hashes for headers)
     # Remove *bold*, **italic**, ***bolditalic***
-    cleaned_text = re.sub(r'\*\*\*(.*?)\*\*\*', r'\1', text_input) # Must be first for ***
-    cleaned_text = re.sub(r'\*\*(.*?)\*\*', r'\1', cleaned_text)   # Then **
-    cleaned_text = re.sub(r'\*(.*?)\*', r'\1', cleaned_text)       # Then *
+    cleaned_text = _BOLD_ITALIC_RE.sub(r'\1', text_input) # Must be first for ***
+    cleaned_text = _BOLD_RE.sub(r'\1', cleaned_text)   # Then **
+    cleaned_text = _ITALIC_RE.sub(r'\1', cleaned_text)       # Then *
     # Remove #, ##, ### headers
-    cleaned_text = re.sub(r'^#+\s*', '', cleaned_text, flags=re.MULTILINE) 
-
-    # Remove emojis (this is a basic range, more comprehensive regex is possible but larger)
-    # Basic BMP emoji pattern
-    emoji_pattern = re.compile("["
-                               u"\U0001F600-\U0001F64F"  # emoticons
-                               u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                               u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                               u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                               u"\u2600-\u26FF"          # miscellaneous symbols
-                               u"\u2700-\u27BF"          # dingbats
-                               u"\uFE0F"                # variation selector
-                               u"\U0001F900-\U0001F9FF"  # supplemental symbols and pictographs
-                               "]+", flags=re.UNICODE)
-    cleaned_text = emoji_pattern.sub(r'', cleaned_text)
+    cleaned_text = _HEADER_RE.sub('', cleaned_text)
+
+    # Remove emojis
+    cleaned_text = _EMOJI_RE.sub(r'', cleaned_text)
 
     # Replace multiple spaces with a single space
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+    cleaned_text = _WHITESPACE_RE.sub(' ', cleaned_text).strip()
 
     # Specific known artifacts like "```" for code blocks (optional, can be expanded)
     cleaned_text = cleaned_text.replace('```', '')